@@ -2,6 +2,10 @@
 
 from typing import Any
 
+class InputHandle:
+    """Input document pre-parsed by `parse_input`. Bound to the creating thread."""
+
+
 def load_policy(
     policy_path: str,
     data_json: str | None = None,
@@ -23,3 +27,23 @@ def evaluate(input_json: str) -> str:
 def evaluate_parsed(input_json: str) -> Any:
     """Evaluate policy and return parsed Python object (dict/list). Thread-safe."""
     ...
+
+def evaluate_batch(input_json: str, n: int) -> None:
+    """Evaluate policy `n` times with the same input, discarding results. Releases the GIL."""
+    ...
+
+def prime(input_json: str = "{}") -> None:
+    """Build this thread's engine and run one discarded evaluation."""
+    ...
+
+def evaluate_timed(input_json: str, warmup: int, iters: int) -> int:
+    """Evaluate `warmup` untimed then `iters` timed times, GIL released. Returns timed nanoseconds."""
+    ...
+
+def parse_input(input_json: str) -> InputHandle:
+    """Parse input JSON once for repeated `evaluate_prepared` calls."""
+    ...
+
+def evaluate_prepared(handle: InputHandle) -> str:
+    """Evaluate policy against a pre-parsed input. Returns result as JSON string."""
+    ...
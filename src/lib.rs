@@ -4,6 +4,7 @@ use pyo3::types::{PyDict, PyList, PyString};
 use std::cell::RefCell;
 use std::sync::atomic::{AtomicU64, Ordering};
 use std::sync::RwLock;
+use std::time::Instant;
 
 // ── Policy config (shared, read-heavy) ──────────────────────
 
@@ -39,11 +40,13 @@ fn build_engine(cfg: &PolicyConfig) -> Result<regorus::Engine, String> {
     Ok(engine)
 }
 
-fn do_eval(input_json: &str) -> Result<String, String> {
+/// Run `f` against this thread's cached engine for the current policy.
+fn with_engine<T>(
+    f: impl FnOnce(&mut regorus::Engine, &str) -> Result<T, String>,
+) -> Result<T, String> {
     let guard = POLICY.read().unwrap();
     let cfg = guard.as_ref().ok_or("call load_policy() first")?;
     let ver = POLICY_VERSION.load(Ordering::Acquire);
-    let query = cfg.query.clone();
 
     CACHED_ENGINE.with(|cell| {
         let mut slot = cell.borrow_mut();
@@ -58,17 +61,40 @@ fn do_eval(input_json: &str) -> Result<String, String> {
         }
 
         let (_, engine) = slot.as_mut().unwrap();
-
-        engine
-            .set_input_json(input_json)
-            .map_err(|e| format!("{e:#}"))?;
-        let value = engine
-            .eval_rule(query)
-            .map_err(|e| format!("{e:#}"))?;
-        Ok(value.to_string())
+        f(engine, &cfg.query)
     })
 }
 
+fn eval_query(engine: &mut regorus::Engine, query: &str) -> Result<regorus::Value, String> {
+    engine
+        .eval_rule(query.to_string())
+        .map_err(|e| format!("{e:#}"))
+}
+
+fn eval_once(
+    engine: &mut regorus::Engine,
+    query: &str,
+    input_json: &str,
+) -> Result<regorus::Value, String> {
+    engine
+        .set_input_json(input_json)
+        .map_err(|e| format!("{e:#}"))?;
+    eval_query(engine, query)
+}
+
+fn do_eval(input_json: &str) -> Result<String, String> {
+    with_engine(|engine, query| Ok(eval_once(engine, query, input_json)?.to_string()))
+}
+
+// ── Pre-parsed input ────────────────────────────────────────
+
+/// Input document parsed once by parse_input() and reused across
+/// evaluate_prepared() calls, skipping the per-call JSON parse.
+#[pyclass(unsendable, module = "opa_eval")]
+struct InputHandle {
+    value: regorus::Value,
+}
+
 // ── JSON → Python conversion (no Python json module) ────────
 
 fn json_to_py(py: Python<'_>, v: &serde_json::Value) -> PyResult<PyObject> {
@@ -160,5 +186,69 @@ fn opa_eval(m: &Bound<'_, PyModule>) -> PyResult<()> {
         json_to_py(py, &value)
     }
 
+    /// Evaluate the same input `n` times in one call, discarding results.
+    /// The loop runs in Rust with the GIL released, so benchmarks can
+    /// measure policy evaluation without per-call FFI overhead.
+    #[pyfn(m)]
+    fn evaluate_batch(py: Python<'_>, input_json: &str, n: usize) -> PyResult<()> {
+        py.allow_threads(|| {
+            with_engine(|engine, query| {
+                for _ in 0..n {
+                    eval_once(engine, query, input_json)?;
+                }
+                Ok(())
+            })
+        })
+        .map_err(|e| PyRuntimeError::new_err(e))
+    }
+
+    /// Build this thread's engine and run one evaluation, discarding the
+    /// result, so the next call doesn't pay first-evaluation costs.
+    #[pyfn(m)]
+    #[pyo3(signature = (input_json="{}"))]
+    fn prime(input_json: &str) -> PyResult<()> {
+        with_engine(|engine, query| eval_once(engine, query, input_json).map(|_| ()))
+            .map_err(|e| PyRuntimeError::new_err(e))
+    }
+
+    /// Evaluate `warmup` untimed then `iters` timed times with the GIL
+    /// released. Returns the elapsed nanoseconds of the timed iterations.
+    #[pyfn(m)]
+    fn evaluate_timed(py: Python<'_>, input_json: &str, warmup: usize, iters: usize) -> PyResult<u64> {
+        py.allow_threads(|| {
+            with_engine(|engine, query| {
+                for _ in 0..warmup {
+                    eval_once(engine, query, input_json)?;
+                }
+                let start = Instant::now();
+                for _ in 0..iters {
+                    eval_once(engine, query, input_json)?;
+                }
+                Ok(start.elapsed().as_nanos() as u64)
+            })
+        })
+        .map_err(|e| PyRuntimeError::new_err(e))
+    }
+
+    /// Parse an input JSON string once for repeated evaluate_prepared() calls.
+    #[pyfn(m)]
+    fn parse_input(input_json: &str) -> PyResult<InputHandle> {
+        let value = regorus::Value::from_json_str(input_json)
+            .map_err(|e| PyRuntimeError::new_err(format!("invalid input JSON: {e:#}")))?;
+        Ok(InputHandle { value })
+    }
+
+    /// Evaluate the loaded policy against a pre-parsed input.
+    /// Returns the result as a JSON string, like evaluate().
+    #[pyfn(m)]
+    fn evaluate_prepared(handle: PyRef<'_, InputHandle>) -> PyResult<String> {
+        with_engine(|engine, query| {
+            engine.set_input(handle.value.clone());
+            Ok(eval_query(engine, query)?.to_string())
+        })
+        .map_err(|e| PyRuntimeError::new_err(e))
+    }
+
+    m.add_class::<InputHandle>()?;
     Ok(())
 }
@@ -1,15 +1,17 @@
 """Benchmark: opa_eval (Rust/regorus) vs OPA REST API vs OPA CLI."""
 
+import argparse
 import atexit
-import json
+import contextlib
 import os
+import shutil
 import signal
+import statistics
 import subprocess
 import tempfile
 import time
 
-import plotly.graph_objects as go
-import requests
+import orjson
 
 import opa_eval
 
@@ -17,6 +19,9 @@ POLICY_PATH = os.path.join(os.path.dirname(__file__), "policy.rego")
 ITERATIONS = 500
 OPA_PORT = 18181
 OPA_BASE = f"http://localhost:{OPA_PORT}"
+# Absolute path so subprocess can take the posix_spawn (vfork) fast path,
+# which it only does when the executable includes a directory.
+OPA_BIN = shutil.which("opa") or "opa"
 
 DATA_POLICY = """\
 package rbac
@@ -33,49 +38,118 @@ allow if {
 
 ROLES_DATA = {"roles": {f"user{i}": ("admin" if i % 10 == 0 else "viewer") for i in range(100)}}
 
+# Shared by every "Large input" bench so it is built once at import
+_LARGE_EXTRA = {f"key{i}": f"val{i}" for i in range(200)}
+_LARGE_INPUT_JSON = orjson.dumps({"role": "admin", "extra": _LARGE_EXTRA}).decode()
+
+
+def _write_once(content: str, suffix: str) -> str:
+    """Write `content` to a temp file that is removed at exit; return its path."""
+    with tempfile.NamedTemporaryFile(suffix=suffix, mode="w", delete=False) as f:
+        f.write(content)
+    atexit.register(os.unlink, f.name)
+    return f.name
+
+
+# The "With ext data" benches share one policy file and one data file
+_ROLES_JSON = orjson.dumps(ROLES_DATA).decode()
+_DATA_POLICY_PATH = _write_once(DATA_POLICY, ".rego")
+_ROLES_DATA_PATH = _write_once(_ROLES_JSON, ".json")
+
 
 # ── OPA server lifecycle ─────────────────────────────────────
 
 _opa_proc = None
+_opa_policies = ()
+
+# Every REST scenario's policies, loaded into one server so they can share it
+_REST_POLICIES = (POLICY_PATH, _DATA_POLICY_PATH)
 
 
 def start_opa_server(*policy_files):
     """Start OPA in server mode, loading the given policy files."""
-    global _opa_proc
+    import requests
+
+    global _opa_proc, _opa_policies
     stop_opa_server()
     cmd = ["opa", "run", "-s", "--addr", f":{OPA_PORT}", "--log-level", "error", *policy_files]
     _opa_proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-    # Wait until healthy
-    for _ in range(40):
+    _opa_policies = policy_files
+    # Wait until healthy; OPA usually starts in tens of ms, so back off
+    # exponentially from a short first poll, within the same 4 s budget
+    delay = 0.005
+    deadline = time.monotonic() + 4.0
+    while time.monotonic() < deadline:
         try:
             r = requests.get(f"{OPA_BASE}/health", timeout=0.5)
             if r.status_code == 200:
                 return
         except requests.ConnectionError:
             pass
-        time.sleep(0.1)
+        time.sleep(delay)
+        delay = min(delay * 2, 0.1)
     raise RuntimeError("OPA server failed to start")
 
 
 def stop_opa_server():
-    global _opa_proc
+    global _opa_proc, _opa_policies
     if _opa_proc is not None:
         _opa_proc.send_signal(signal.SIGTERM)
         _opa_proc.wait(timeout=5)
         _opa_proc = None
+        _opa_policies = ()
+
+
+@contextlib.contextmanager
+def opa_running(*policy_files):
+    """Keep an OPA server with `policy_files` up for the block.
+
+    A server already running the same files is reused and left running,
+    so an outer block can share one server across several benches.
+    """
+    if _opa_proc is not None and _opa_policies == policy_files:
+        yield
+        return
+    start_opa_server(*policy_files)
+    try:
+        yield
+    finally:
+        stop_opa_server()
 
 
 atexit.register(stop_opa_server)
 
 
+# One keep-alive connection reused across iterations, so the REST benches
+# measure request/response cost rather than a TCP handshake per call.
+_SESSION = None
+_H = {"Content-Type": "application/json", "Accept": "application/json"}
+
+
+def _session():
+    """Return the shared REST session, creating it (and importing requests) on first use."""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        _SESSION = requests.Session()
+        _SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=32))
+    return _SESSION
+
+
 def opa_rest_put_data(data: dict):
     """PUT external data into the running OPA server."""
+    import requests
+
     r = requests.put(f"{OPA_BASE}/v1/data", json=data, timeout=5)
     r.raise_for_status()
 
 
 def opa_rest_eval(path: str, input_data: dict) -> dict:
     """POST to OPA REST API to evaluate a policy rule."""
+    import requests
+
     r = requests.post(f"{OPA_BASE}/v1/data/{path}", json={"input": input_data}, timeout=5)
     r.raise_for_status()
     return r.json()
@@ -83,160 +157,240 @@ def opa_rest_eval(path: str, input_data: dict) -> dict:
 
 # ── Benchmark functions ──────────────────────────────────────
 
+def _auto_warmup(fn, inp, max_s: float = 2.0, threshold: float = 1e-3) -> int:
+    """Call `fn(inp)` until its latency settles and return the number of calls.
+
+    Every 8 calls the median absolute deviation of the recent samples is
+    compared to their median; warm-up ends once the ratio drops below
+    `threshold` (loosened by 1e-4 per call so noisy paths still converge)
+    or after `max_s` seconds.
+    """
+    samples = []
+    deadline = time.perf_counter_ns() + int(max_s * 1e9)
+    while True:
+        t0 = time.perf_counter_ns()
+        fn(inp)
+        t1 = time.perf_counter_ns()
+        samples.append(t1 - t0)
+        n = len(samples)
+        if n % 8 == 0:
+            recent = samples[-32:]
+            med = statistics.median(recent)
+            mad = statistics.median(abs(x - med) for x in recent)
+            if mad < med * (threshold + 1e-4 * n):
+                return n
+        if t1 >= deadline:
+            return n
+
+
+def _summary(setup_ns: int, warmup_ns: int, samples: list) -> dict:
+    """Collapse per-call latencies (ns) into the figures the report shows."""
+    return {
+        "setup": setup_ns,
+        "warmup": warmup_ns,
+        "median": statistics.median(samples),
+        "p99": statistics.quantiles(samples, n=100, method="inclusive")[98],
+    }
+
+
+def _timed(fn, inp, iters: int, setup_ns: int = 0) -> dict:
+    """Warm `fn(inp)` up, then time `iters` calls one by one.
+
+    Returns nanosecond `setup` (as measured by the caller), `warmup`
+    (total warm-up time) and the `median` / `p99` per-call latency.
+    """
+    t0 = time.perf_counter_ns()
+    _auto_warmup(fn, inp)
+    warmup_ns = time.perf_counter_ns() - t0
+    samples = [0] * iters
+    for i in range(iters):
+        t0 = time.perf_counter_ns()
+        fn(inp)
+        samples[i] = time.perf_counter_ns() - t0
+    return _summary(setup_ns, warmup_ns, samples)
+
+
 # --- Rust (in-process) -------
 
-def bench_rust_simple(iterations: int) -> float:
+def _timed_in_rust(inp: str, iters: int, setup_ns: int = 0) -> dict:
+    """Like `_timed(opa_eval.evaluate, ...)`, but each call is clocked inside Rust.
+
+    Each of the `iters` samples is its own `evaluate_timed(inp, 0, 1)` call,
+    so the figures exclude the FFI crossing and Python's clock reads.
+    """
+    t0 = time.perf_counter_ns()
+    _auto_warmup(opa_eval.evaluate, inp)
+    warmup_ns = time.perf_counter_ns() - t0
+    samples = [opa_eval.evaluate_timed(inp, 0, 1) for _ in range(iters)]
+    return _summary(setup_ns, warmup_ns, samples)
+
+
+def bench_rust_simple(iterations: int) -> dict:
+    t0 = time.perf_counter_ns()
     opa_eval.load_policy(POLICY_PATH, query="data.authz.allow")
-    inp = json.dumps({"role": "admin"})
-    start = time.perf_counter()
-    for _ in range(iterations):
-        opa_eval.evaluate(inp)
-    return time.perf_counter() - start
+    inp = orjson.dumps({"role": "admin"}).decode()
+    opa_eval.prime(inp)
+    return _timed_in_rust(inp, iterations, time.perf_counter_ns() - t0)
 
 
-def bench_rust_deny(iterations: int) -> float:
+def bench_rust_deny(iterations: int) -> dict:
+    t0 = time.perf_counter_ns()
     opa_eval.load_policy(POLICY_PATH, query="data.authz.allow")
-    inp = json.dumps({"role": "viewer"})
-    start = time.perf_counter()
-    for _ in range(iterations):
-        opa_eval.evaluate(inp)
-    return time.perf_counter() - start
-
-
-def bench_rust_with_data(iterations: int) -> float:
-    with tempfile.NamedTemporaryFile(suffix=".rego", mode="w", delete=False) as f:
-        f.write(DATA_POLICY)
-        f.flush()
-        opa_eval.load_policy(f.name, data_json=json.dumps(ROLES_DATA), query="data.rbac.allow")
-    inp = json.dumps({"user": "user0"})
-    start = time.perf_counter()
-    for _ in range(iterations):
-        opa_eval.evaluate(inp)
-    elapsed = time.perf_counter() - start
-    os.unlink(f.name)
-    return elapsed
-
-
-def bench_rust_large_input(iterations: int) -> float:
+    inp = orjson.dumps({"role": "viewer"}).decode()
+    opa_eval.prime(inp)
+    return _timed_in_rust(inp, iterations, time.perf_counter_ns() - t0)
+
+
+def bench_rust_with_data(iterations: int) -> dict:
+    t0 = time.perf_counter_ns()
+    opa_eval.load_policy(_DATA_POLICY_PATH, data_json=_ROLES_JSON, query="data.rbac.allow")
+    inp = orjson.dumps({"user": "user0"}).decode()
+    opa_eval.prime(inp)
+    return _timed_in_rust(inp, iterations, time.perf_counter_ns() - t0)
+
+
+def bench_rust_large_input(iterations: int) -> dict:
+    t0 = time.perf_counter_ns()
     opa_eval.load_policy(POLICY_PATH, query="data.authz.allow")
-    inp = json.dumps({"role": "admin", "extra": {f"key{i}": f"val{i}" for i in range(200)}})
-    start = time.perf_counter()
-    for _ in range(iterations):
-        opa_eval.evaluate(inp)
-    return time.perf_counter() - start
+    inp = _LARGE_INPUT_JSON
+    opa_eval.prime(inp)
+    return _timed_in_rust(inp, iterations, time.perf_counter_ns() - t0)
 
 
-# --- OPA REST API -------
+def bench_rust_single_call(iterations: int) -> dict:
+    """Simple allow via one `evaluate()` per iteration, to attribute FFI overhead."""
+    t0 = time.perf_counter_ns()
+    opa_eval.load_policy(POLICY_PATH, query="data.authz.allow")
+    inp = orjson.dumps({"role": "admin"}).decode()
+    opa_eval.prime(inp)
+    return _timed(opa_eval.evaluate, inp, iterations, time.perf_counter_ns() - t0)
 
-def bench_rest_simple(iterations: int) -> float:
-    start_opa_server(POLICY_PATH)
-    payload = {"input": {"role": "admin"}}
-    url = f"{OPA_BASE}/v1/data/authz/allow"
-    start = time.perf_counter()
-    for _ in range(iterations):
-        requests.post(url, json=payload)
-    elapsed = time.perf_counter() - start
-    stop_opa_server()
-    return elapsed
 
+def bench_rust_simple_prepared(iterations: int) -> dict:
+    """Simple allow against a pre-parsed input, to show the JSON-parse share."""
+    t0 = time.perf_counter_ns()
+    opa_eval.load_policy(POLICY_PATH, query="data.authz.allow")
+    inp = orjson.dumps({"role": "admin"}).decode()
+    opa_eval.prime(inp)
+    h = opa_eval.parse_input(inp)
+    return _timed(opa_eval.evaluate_prepared, h, iterations, time.perf_counter_ns() - t0)
 
-def bench_rest_deny(iterations: int) -> float:
-    start_opa_server(POLICY_PATH)
-    payload = {"input": {"role": "viewer"}}
-    url = f"{OPA_BASE}/v1/data/authz/allow"
-    start = time.perf_counter()
-    for _ in range(iterations):
-        requests.post(url, json=payload)
-    elapsed = time.perf_counter() - start
-    stop_opa_server()
-    return elapsed
-
-
-def bench_rest_with_data(iterations: int) -> float:
-    with tempfile.NamedTemporaryFile(suffix=".rego", mode="w", delete=False) as f:
-        f.write(DATA_POLICY)
-        f.flush()
-        policy_file = f.name
-    start_opa_server(policy_file)
-    opa_rest_put_data(ROLES_DATA)
-    payload = {"input": {"user": "user0"}}
-    url = f"{OPA_BASE}/v1/data/rbac/allow"
-    start = time.perf_counter()
-    for _ in range(iterations):
-        requests.post(url, json=payload)
-    elapsed = time.perf_counter() - start
-    stop_opa_server()
-    os.unlink(policy_file)
-    return elapsed
-
-
-def bench_rest_large_input(iterations: int) -> float:
-    start_opa_server(POLICY_PATH)
-    payload = {"input": {"role": "admin", "extra": {f"key{i}": f"val{i}" for i in range(200)}}}
-    url = f"{OPA_BASE}/v1/data/authz/allow"
-    start = time.perf_counter()
-    for _ in range(iterations):
-        requests.post(url, json=payload)
-    elapsed = time.perf_counter() - start
-    stop_opa_server()
-    return elapsed
+
+# --- OPA REST API -------
+
+def _prepare_post(url: str, body: bytes):
+    """Build the POST once so the timed loop only calls `session.send()`."""
+    import requests
+
+    prepared = _session().prepare_request(requests.Request("POST", url, data=body, headers=_H))
+    if prepared.body is not body:
+        raise RuntimeError("prepared request copied the body")
+    return prepared
+
+
+def bench_rest_simple(iterations: int) -> dict:
+    t0 = time.perf_counter_ns()
+    with opa_running(*_REST_POLICIES):
+        payload = {"input": {"role": "admin"}}
+        url = f"{OPA_BASE}/v1/data/authz/allow"
+        body = orjson.dumps(payload)
+        req = _prepare_post(url, body)
+        return _timed(_session().send, req, iterations, time.perf_counter_ns() - t0)
+
+
+def bench_rest_deny(iterations: int) -> dict:
+    t0 = time.perf_counter_ns()
+    with opa_running(*_REST_POLICIES):
+        payload = {"input": {"role": "viewer"}}
+        url = f"{OPA_BASE}/v1/data/authz/allow"
+        body = orjson.dumps(payload)
+        req = _prepare_post(url, body)
+        return _timed(_session().send, req, iterations, time.perf_counter_ns() - t0)
+
+
+def bench_rest_with_data(iterations: int) -> dict:
+    t0 = time.perf_counter_ns()
+    with opa_running(*_REST_POLICIES):
+        opa_rest_put_data(ROLES_DATA)
+        payload = {"input": {"user": "user0"}}
+        url = f"{OPA_BASE}/v1/data/rbac/allow"
+        body = orjson.dumps(payload)
+        req = _prepare_post(url, body)
+        return _timed(_session().send, req, iterations, time.perf_counter_ns() - t0)
+
+
+def bench_rest_large_input(iterations: int) -> dict:
+    t0 = time.perf_counter_ns()
+    with opa_running(*_REST_POLICIES):
+        payload = {"input": {"role": "admin", "extra": _LARGE_EXTRA}}
+        url = f"{OPA_BASE}/v1/data/authz/allow"
+        body = orjson.dumps(payload)
+        req = _prepare_post(url, body)
+        return _timed(_session().send, req, iterations, time.perf_counter_ns() - t0)
 
 
 # --- OPA CLI (subprocess) -------
 
-def bench_cli_simple(iterations: int) -> float:
-    inp = json.dumps({"role": "admin"})
-    start = time.perf_counter()
-    for _ in range(iterations):
-        subprocess.run(
-            ["opa", "eval", "-d", POLICY_PATH, "-i", "/dev/stdin", "data.authz.allow"],
-            input=inp, capture_output=True, text=True, check=True,
-        )
-    return time.perf_counter() - start
+def _cli_eval(*args: str):
+    """Return a function that runs `opa eval *args` with its bytes argument on stdin."""
+    cmd = [OPA_BIN, "eval", *args]
+    return lambda inp: subprocess.run(
+        cmd, input=inp, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        check=True, close_fds=False,
+    )
 
 
-def bench_cli_deny(iterations: int) -> float:
-    inp = json.dumps({"role": "viewer"})
-    start = time.perf_counter()
-    for _ in range(iterations):
-        subprocess.run(
-            ["opa", "eval", "-d", POLICY_PATH, "-i", "/dev/stdin", "data.authz.allow"],
-            input=inp, capture_output=True, text=True, check=True,
-        )
-    return time.perf_counter() - start
-
-
-def bench_cli_with_data(iterations: int) -> float:
-    with tempfile.NamedTemporaryFile(suffix=".rego", mode="w", delete=False) as pf:
-        pf.write(DATA_POLICY)
-        pf.flush()
-        policy_file = pf.name
-    with tempfile.NamedTemporaryFile(suffix=".json", mode="w", delete=False) as df:
-        json.dump(ROLES_DATA, df)
-        df.flush()
-        data_file = df.name
-    inp = json.dumps({"user": "user0"})
-    start = time.perf_counter()
-    for _ in range(iterations):
-        subprocess.run(
-            ["opa", "eval", "-d", policy_file, "--data", data_file, "-i", "/dev/stdin", "data.rbac.allow"],
-            input=inp, capture_output=True, text=True, check=True,
-        )
-    elapsed = time.perf_counter() - start
-    os.unlink(policy_file)
-    os.unlink(data_file)
-    return elapsed
-
-
-def bench_cli_large_input(iterations: int) -> float:
-    inp = json.dumps({"role": "admin", "extra": {f"key{i}": f"val{i}" for i in range(200)}})
-    start = time.perf_counter()
-    for _ in range(iterations):
-        subprocess.run(
-            ["opa", "eval", "-d", POLICY_PATH, "-i", "/dev/stdin", "data.authz.allow"],
-            input=inp, capture_output=True, text=True, check=True,
-        )
-    return time.perf_counter() - start
+def bench_cli_simple(iterations: int) -> dict:
+    inp = orjson.dumps({"role": "admin"})
+    fn = _cli_eval("-d", POLICY_PATH, "-i", "/dev/stdin", "data.authz.allow")
+    return _timed(fn, inp, iterations)
+
+
+def bench_cli_deny(iterations: int) -> dict:
+    inp = orjson.dumps({"role": "viewer"})
+    fn = _cli_eval("-d", POLICY_PATH, "-i", "/dev/stdin", "data.authz.allow")
+    return _timed(fn, inp, iterations)
+
+
+def bench_cli_with_data(iterations: int) -> dict:
+    inp = orjson.dumps({"user": "user0"})
+    fn = _cli_eval("-d", _DATA_POLICY_PATH, "--data", _ROLES_DATA_PATH, "-i", "/dev/stdin", "data.rbac.allow")
+    return _timed(fn, inp, iterations)
+
+
+def bench_cli_large_input(iterations: int) -> dict:
+    inp = _LARGE_INPUT_JSON.encode()
+    fn = _cli_eval("-d", POLICY_PATH, "-i", "/dev/stdin", "data.authz.allow")
+    return _timed(fn, inp, iterations)
+
+
+def bench_cli_warm(iterations: int) -> dict:
+    """Simple allow through one long-lived `opa run` REPL instead of a process per eval."""
+    t0 = time.perf_counter_ns()
+    proc = subprocess.Popen(
+        [OPA_BIN, "run", POLICY_PATH],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        text=True, bufsize=1,
+    )
+
+    def query(q):
+        proc.stdin.write(q)
+        proc.stdout.readline()
+
+    try:
+        # Skip the banner: wait for a sentinel to echo back before timing
+        proc.stdin.write('"__ready__"\n')
+        for line in proc.stdout:
+            if "__ready__" in line:
+                break
+        else:
+            raise RuntimeError("OPA REPL exited before becoming ready")
+        q = f"data.authz.allow with input as {orjson.dumps({'role': 'admin'}).decode()}\n"
+        stats = _timed(query, q, iterations, time.perf_counter_ns() - t0)
+    finally:
+        proc.stdin.close()
+        proc.wait(timeout=5)
+    return stats
 
 
 # ── Scenario registry ────────────────────────────────────────
@@ -249,47 +403,108 @@ SCENARIOS = [
     ("Large input",      bench_rust_large_input, bench_rest_large_input, bench_cli_large_input),
 ]
 
+# Simple-allow variants reported below the summary table; the first is
+# the baseline the others are compared with
+EXTRAS = [
+    ("Rust/PyO3, per-call",   bench_rust_single_call),
+    ("Rust/PyO3, pre-parsed", bench_rust_simple_prepared),
+    ("OPA CLI, warm REPL",    bench_cli_warm),
+]
+
 
 # ── Run & chart ──────────────────────────────────────────────
 
+def _us(stats: dict, key: str = "median") -> float:
+    return stats[key] / 1000
+
+
 def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--no-chart", action="store_true",
+                        help="print results only, without importing Plotly")
+    args = parser.parse_args()
     iters = ITERATIONS
 
     print(f"Benchmarking  ({iters} iterations each)\n")
 
-    results = []
-    for label, rust_fn, rest_fn, cli_fn in SCENARIOS:
-        print(f"  {label}:", flush=True)
-
-        t_rust = rust_fn(iters)
-        us_rust = (t_rust / iters) * 1_000_000
-        print(f"    Rust/PyO3   {us_rust:>10.1f} us/op", flush=True)
-
-        t_rest = rest_fn(iters)
-        us_rest = (t_rest / iters) * 1_000_000
-        spd_rest = us_rest / us_rust
-        print(f"    OPA REST    {us_rest:>10.0f} us/op  ({spd_rest:>6.0f}x vs Rust)", flush=True)
-
-        t_cli = cli_fn(iters)
-        us_cli = (t_cli / iters) * 1_000_000
-        spd_cli = us_cli / us_rust
-        print(f"    OPA CLI     {us_cli:>10.0f} us/op  ({spd_cli:>6.0f}x vs Rust)", flush=True)
-
-        results.append((label, us_rust, us_rest, us_cli))
-
-    # ── Summary table ────────────────────────────────────────
-    print("\n" + "=" * 82)
-    print(f"{'Scenario':<16} {'Rust (us)':>10} {'REST (us)':>11} {'CLI (us)':>11} {'REST/Rust':>10} {'CLI/Rust':>10}")
-    print("-" * 82)
+    # Rust and CLI run with no OPA server around; REST gets its own pass
+    # below so the idle server adds no background load to the other numbers
+    rust_runs, rest_runs, cli_runs = {}, {}, {}
+    for label, rust_fn, _, _ in SCENARIOS:
+        rust_runs[label] = st = rust_fn(iters)
+        print(f"  {label:<16} Rust/PyO3 {_us(st):>10.1f} us/op  p99 {_us(st, 'p99'):>8.1f}", flush=True)
+
+    # One OPA server for every REST scenario; its start-up is reported once
+    t0 = time.perf_counter_ns()
+    with opa_running(*_REST_POLICIES):
+        server_ms = (time.perf_counter_ns() - t0) / 1e6
+        for label, _, rest_fn, _ in SCENARIOS:
+            rest_runs[label] = st = rest_fn(iters)
+            print(f"  {label:<16} OPA REST  {_us(st):>10.0f} us/op  p99 {_us(st, 'p99'):>8.0f}  "
+                  f"({st['median'] / rust_runs[label]['median']:>6.0f}x vs Rust)", flush=True)
+
+    for label, _, _, cli_fn in SCENARIOS:
+        cli_runs[label] = st = cli_fn(iters)
+        print(f"  {label:<16} OPA CLI   {_us(st):>10.0f} us/op  p99 {_us(st, 'p99'):>8.0f}  "
+              f"({st['median'] / rust_runs[label]['median']:>6.0f}x vs Rust)", flush=True)
+
+    results = [(label, rust_runs[label], rest_runs[label], cli_runs[label]) for label, *_ in SCENARIOS]
+
+    # ── Summary table (steady state, us/op) ──────────────────
+    print("\n" + "=" * 104)
+    print(f"{'Scenario':<16} {'Rust p50':>9} {'p99':>8} {'REST p50':>10} {'p99':>8} "
+          f"{'CLI p50':>10} {'p99':>8} {'REST/Rust':>10} {'CLI/Rust':>10}")
+    print("-" * 104)
     for label, r, rest, cli in results:
-        print(f"{label:<16} {r:>10.1f} {rest:>11.0f} {cli:>11.0f} {rest/r:>9.0f}x {cli/r:>9.0f}x")
-    print("=" * 82)
+        print(f"{label:<16} {_us(r):>9.1f} {_us(r, 'p99'):>8.1f} {_us(rest):>10.0f} {_us(rest, 'p99'):>8.0f} "
+              f"{_us(cli):>10.0f} {_us(cli, 'p99'):>8.0f} "
+              f"{rest['median']/r['median']:>9.0f}x {cli['median']/r['median']:>9.0f}x")
+    print("=" * 104)
+
+    # ── One-time costs (ms) ──────────────────────────────────
+    print(f"\nShared OPA server start: {server_ms:.1f} ms (not included in REST setup below)")
+    print(f"\n{'Scenario':<16} {'Rust setup':>11} {'warmup':>8} {'REST setup':>11} {'warmup':>8} "
+          f"{'CLI setup':>11} {'warmup':>8}")
+    for label, *stats in results:
+        print(f"{label:<16}" + "".join(
+            f" {st['setup'] / 1e6:>11.1f} {st['warmup'] / 1e6:>8.1f}" for st in stats
+        ))
+
+    # These are clocked from Python, so compare them with the Python-timed
+    # per-call variant (EXTRAS[0]) rather than the in-Rust figure above
+    print("\nSimple allow variants (timed from Python, FFI included):")
+    per_call = None
+    for label, fn in EXTRAS:
+        st = fn(iters)
+        per_call = per_call or st
+        print(f"  {label:<22} {_us(st):>10.1f} us/op  p99 {_us(st, 'p99'):>8.1f}  "
+              f"({st['median'] / per_call['median']:>6.1f}x vs per-call)", flush=True)
+
+    if not args.no_chart:
+        _render(results)
+
+
+def _render(results):
+    """Chart `results` to HTML, plus a PNG unless BENCH_FAST is set."""
+    import plotly.graph_objects as go
+    import plotly.io as pio
 
     # ── Build chart data ──────────────────────────────────────
     labels = [r[0] for r in results]
-    rust_us = [r[1] for r in results]
-    rest_us = [r[2] for r in results]
-    cli_us  = [r[3] for r in results]
+    rust_us = [_us(r[1]) for r in results]
+    rest_us = [_us(r[2]) for r in results]
+    cli_us  = [_us(r[3]) for r in results]
+    rust_p99 = [_us(r[1], "p99") for r in results]
+    rest_p99 = [_us(r[2], "p99") for r in results]
+    cli_p99  = [_us(r[3], "p99") for r in results]
+
+    def p99_whisker(med, p99, color):
+        """Error bar reaching from the median bar out to p99."""
+        return dict(
+            type="data", symmetric=False,
+            array=[p - m for m, p in zip(med, p99)], arrayminus=[0] * len(med),
+            color=color, thickness=1.5, width=5,
+        )
 
     fig = go.Figure()
 
@@ -306,6 +521,7 @@ def main():
             color="rgba(255, 75, 75, 0.85)",
             line=dict(color="rgba(255, 120, 120, 1)", width=1),
         ),
+        error_x=p99_whisker(cli_us, cli_p99, "rgba(255, 160, 160, 0.9)"),
         text=cli_text,
         textposition="inside",
         insidetextanchor="end",
@@ -325,6 +541,7 @@ def main():
             color="rgba(255, 183, 50, 0.85)",
             line=dict(color="rgba(255, 210, 100, 1)", width=1),
         ),
+        error_x=p99_whisker(rest_us, rest_p99, "rgba(255, 225, 150, 0.9)"),
         text=rest_text,
         textposition="inside",
         insidetextanchor="end",
@@ -340,6 +557,7 @@ def main():
             color="rgba(0, 230, 118, 0.9)",
             line=dict(color="rgba(100, 255, 180, 1)", width=2),
         ),
+        error_x=p99_whisker(rust_us, rust_p99, "rgba(150, 255, 200, 0.9)"),
         text=[f"  <b>{v:.0f} us</b>" for v in rust_us],
         textposition="outside",
         textfont=dict(color="#00e676", size=14, family="monospace"),
@@ -347,7 +565,7 @@ def main():
 
     # --- Layout: dark theme, log scale ---
     import math
-    max_cli = max(cli_us)
+    max_cli = max(cli_p99)
     max_x = max_cli * 2.5  # room for labels
     fig.update_layout(
         template="plotly_dark",
@@ -358,7 +576,7 @@ def main():
                 "<b style='color:#00e676; font-size:24px'>opa_eval</b>"
                 "<b style='font-size:20px'>  (Rust/regorus)  vs  OPA REST  vs  OPA CLI</b><br>"
                 "<span style='font-size:14px; color:#8b949e'>"
-                "Per-evaluation latency (us)  |  Log scale  |  Lower is better  |  "
+                "Median latency per evaluation (us), whiskers to p99  |  Log scale  |  Lower is better  |  "
                 "Nx = times slower than Rust</span>"
             ),
             font=dict(size=20, color="#e6edf3"),
@@ -397,9 +615,15 @@ def main():
 
     chart_path = os.path.join(os.path.dirname(__file__), "bench_chart.png")
     html_path  = os.path.join(os.path.dirname(__file__), "bench_chart.html")
-    fig.write_image(chart_path, scale=2)
+    print()
+    if not os.environ.get("BENCH_FAST"):
+        # Kaleido's Chromium start-up dominates PNG export; skip MathJax loading
+        scope = getattr(pio.kaleido, "scope", None)
+        if scope is not None:
+            scope.mathjax = None
+        fig.write_image(chart_path, scale=2)
+        print(f"Chart saved to {chart_path}")
     fig.write_html(html_path)
-    print(f"\nChart saved to {chart_path}")
     print(f"Interactive chart saved to {html_path}")
     fig.show()
 
@@ -2,6 +2,8 @@ import json
 import os
 import tempfile
 
+import pytest
+
 import opa_eval
 
 POLICY_PATH = os.path.join(os.path.dirname(__file__), "policy.rego")
@@ -84,75 +86,103 @@ from concurrent.futures import ThreadPoolExecutor
 import time
 import threading
 
+# CI can shorten runs and relax the ops/sec floors; perf hosts can run longer
+DURATION_S = float(os.environ.get("BENCH_DURATION_S", "2.0"))
+MIN_OPS_SCALE = float(os.environ.get("BENCH_MIN_OPS_SCALE", "1.0"))
+
 
-def _throughput(fn, *, workers, duration_s=2.0):
-    """Run `fn` across `workers` threads for `duration_s` and return ops/sec."""
-    stop = threading.Event()
+def _throughput(fn, *, workers, duration_s=DURATION_S):
+    """Run `fn` across `workers` threads for `duration_s` and return ops/sec.
+
+    When the OS supports it and there are more usable CPUs than workers,
+    each worker is pinned to its own CPU and the driver thread to a spare
+    one, so thread migration doesn't add noise.  Otherwise affinity is left
+    alone rather than stacking workers on a shared core.
+    """
     counts = [0] * workers
+    original = os.sched_getaffinity(0) if hasattr(os, "sched_setaffinity") else set()
+    cpus = sorted(original) if len(original) > workers else []
+    driver_cpu = cpus.pop() if cpus else None
 
     def worker(idx):
+        if cpus:
+            os.sched_setaffinity(0, {cpus[idx]})
         c = 0
-        while not stop.is_set():
+        while time.monotonic_ns() < deadline:
             fn()
             c += 1
         counts[idx] = c
 
-    with ThreadPoolExecutor(max_workers=workers) as pool:
-        futs = [pool.submit(worker, i) for i in range(workers)]
-        time.sleep(duration_s)
-        stop.set()
-        for f in futs:
-            f.result()
+    if driver_cpu is not None:
+        os.sched_setaffinity(0, {driver_cpu})
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # A plain clock check is cheaper per iteration than Event.is_set()
+            deadline = time.monotonic_ns() + int(duration_s * 1e9)
+            futs = [pool.submit(worker, i) for i in range(workers)]
+            for f in futs:
+                f.result()
+    finally:
+        if driver_cpu is not None:
+            os.sched_setaffinity(0, original)
 
     total = sum(counts)
     return total / duration_s
 
 
+@pytest.fixture(scope="class")
+def _authz_policy():
+    opa_eval.load_policy(POLICY_PATH, query="data.authz.allow")
+
+
+@pytest.mark.usefixtures("_authz_policy")
 class TestConcurrentThroughput:
     """Sustained multi-thread throughput tests."""
 
-    def test_throughput_1_thread(self):
+    @pytest.fixture
+    def _rbac_policy(self):
+        with tempfile.NamedTemporaryFile(suffix=".rego", mode="w", delete=False) as f:
+            f.write(DATA_POLICY)
+            f.flush()
+            opa_eval.load_policy(
+                f.name,
+                data_json=json.dumps({"roles": ROLES}),
+                query="data.rbac.allow",
+            )
+        yield
+        os.unlink(f.name)
+        # restore the class-wide policy for any test that runs after this one
         opa_eval.load_policy(POLICY_PATH, query="data.authz.allow")
+
+    def test_throughput_1_thread(self):
         inp = json.dumps({"role": "admin"})
         ops = _throughput(lambda: opa_eval.evaluate(inp), workers=1)
         print(f"\n  1 thread: {ops:,.0f} ops/sec")
-        assert ops > 50_000
+        assert ops > 50_000 * MIN_OPS_SCALE
 
     def test_throughput_4_threads(self):
-        opa_eval.load_policy(POLICY_PATH, query="data.authz.allow")
         inp = json.dumps({"role": "admin"})
         ops = _throughput(lambda: opa_eval.evaluate(inp), workers=4)
         print(f"\n  4 threads: {ops:,.0f} ops/sec")
-        assert ops > 100_000
+        assert ops > 100_000 * MIN_OPS_SCALE
 
     def test_throughput_8_threads(self):
-        opa_eval.load_policy(POLICY_PATH, query="data.authz.allow")
         inp = json.dumps({"role": "admin"})
         ops = _throughput(lambda: opa_eval.evaluate(inp), workers=8)
         print(f"\n  8 threads: {ops:,.0f} ops/sec")
-        assert ops > 100_000
+        assert ops > 100_000 * MIN_OPS_SCALE
 
     def test_throughput_parsed_4_threads(self):
-        opa_eval.load_policy(POLICY_PATH, query="data.authz.allow")
         inp = json.dumps({"role": "admin"})
         ops = _throughput(lambda: opa_eval.evaluate_parsed(inp), workers=4)
         print(f"\n  4 threads (parsed): {ops:,.0f} ops/sec")
-        assert ops > 80_000
+        assert ops > 80_000 * MIN_OPS_SCALE
 
-    def test_throughput_with_data_4_threads(self):
-        with tempfile.NamedTemporaryFile(suffix=".rego", mode="w", delete=False) as f:
-            f.write(DATA_POLICY)
-            f.flush()
-            opa_eval.load_policy(
-                f.name,
-                data_json=json.dumps({"roles": ROLES}),
-                query="data.rbac.allow",
-            )
+    def test_throughput_with_data_4_threads(self, _rbac_policy):
         inp = json.dumps({"user": "user0"})
         ops = _throughput(lambda: opa_eval.evaluate(inp), workers=4)
         print(f"\n  4 threads (data): {ops:,.0f} ops/sec")
-        os.unlink(f.name)
-        assert ops > 80_000
+        assert ops > 80_000 * MIN_OPS_SCALE
 
 
 class TestConcurrentCorrectness:
@@ -59,6 +59,88 @@ class TestEvaluateRaw:
         assert parsed is False
 
 
+# ── evaluate_batch() ──────────────────────────────────────
+
+# Two definitions of a complete rule: evaluation fails when they disagree
+CONFLICT_POLICY = """\
+package conflict
+
+import rego.v1
+
+x = input.a if input.a
+
+x = input.b if input.b
+"""
+
+
+class TestEvaluateBatch:
+    def test_returns_none(self):
+        assert opa_eval.evaluate_batch(json.dumps({"role": "admin"}), 10) is None
+
+    def test_invalid_input_json(self):
+        with pytest.raises(RuntimeError):
+            opa_eval.evaluate_batch("not json", 3)
+
+    def test_evaluates_loaded_policy(self):
+        with tempfile.NamedTemporaryFile(suffix=".rego", mode="w", delete=False) as f:
+            f.write(CONFLICT_POLICY)
+            f.flush()
+            opa_eval.load_policy(f.name, query="data.conflict.x")
+        clash = json.dumps({"a": 1, "b": 2})
+        with pytest.raises(RuntimeError):
+            opa_eval.evaluate(clash)
+        # n=0 never evaluates; any n > 0 must hit the same conflict
+        opa_eval.evaluate_batch(clash, 0)
+        with pytest.raises(RuntimeError):
+            opa_eval.evaluate_batch(clash, 3)
+        opa_eval.evaluate_batch(json.dumps({"a": 1, "b": 1}), 3)
+        os.unlink(f.name)
+
+
+# ── prime() / evaluate_timed() ────────────────────────────
+
+class TestEvaluateTimed:
+    def test_evaluates_loaded_policy(self):
+        with tempfile.NamedTemporaryFile(suffix=".rego", mode="w", delete=False) as f:
+            f.write(CONFLICT_POLICY)
+            f.flush()
+            opa_eval.load_policy(f.name, query="data.conflict.x")
+        clash = json.dumps({"a": 1, "b": 2})
+        with pytest.raises(RuntimeError):
+            opa_eval.prime(clash)
+        with pytest.raises(RuntimeError):
+            opa_eval.evaluate_timed(clash, 0, 1)
+        # Warm-up calls evaluate too, they just aren't timed
+        with pytest.raises(RuntimeError):
+            opa_eval.evaluate_timed(clash, 1, 0)
+        opa_eval.evaluate_timed(clash, 0, 0)
+        os.unlink(f.name)
+
+    def test_invalid_input_json(self):
+        with pytest.raises(RuntimeError):
+            opa_eval.evaluate_timed("not json", 0, 1)
+
+
+# ── parse_input() / evaluate_prepared() ───────────────────
+
+class TestEvaluatePrepared:
+    def test_prepared_allow(self):
+        h = opa_eval.parse_input(json.dumps({"role": "admin"}))
+        assert json.loads(opa_eval.evaluate_prepared(h)) is True
+
+    def test_prepared_deny(self):
+        h = opa_eval.parse_input(json.dumps({"role": "viewer"}))
+        assert json.loads(opa_eval.evaluate_prepared(h)) is False
+
+    def test_handle_is_reusable(self):
+        h = opa_eval.parse_input(json.dumps({"role": "admin"}))
+        assert opa_eval.evaluate_prepared(h) == opa_eval.evaluate_prepared(h)
+
+    def test_invalid_input_json(self):
+        with pytest.raises(RuntimeError, match="invalid input JSON"):
+            opa_eval.parse_input("not json")
+
+
 # ── External data ─────────────────────────────────────────
 
 DATA_POLICY = """\